@@ -1,11 +1,49 @@
 import os
 import streamlit as st
 import pandas as pd
-import boto3
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-# Initialize Boto3 client
-connect_client = boto3.client("connect")
+
+@st.cache_resource
+def get_connect_client():
+    """
+    Create the Boto3 Connect client once and reuse it across reruns.
+
+    Returns:
+        botocore.client.BaseClient: Amazon Connect client.
+    """
+    import boto3
+
+    return boto3.client("connect")
+
+
+@st.cache_data(ttl="10m")
+def read_users(mtime):
+    """
+    Read the users file, cached per file modification time.
+
+    Args:
+        mtime (float): Modification time of users.parquet, used as the cache key.
+
+    Returns:
+        pd.DataFrame: DataFrame containing user Id and Username.
+    """
+    return pd.read_parquet("users.parquet", columns=['Id', 'Username'])
+
+
+@st.cache_data(ttl="10m")
+def read_queues(mtime):
+    """
+    Read the queues file, cached per file modification time.
+
+    Args:
+        mtime (float): Modification time of queues.parquet, used as the cache key.
+
+    Returns:
+        pd.DataFrame: DataFrame containing queue information.
+    """
+    return pd.read_parquet("queues.parquet")
 
 
 def get_selected_queues(queues):
@@ -18,8 +56,27 @@ def get_selected_queues(queues):
     Returns:
         list: List of selected queue ARNs.
     """
-    data = [row['Arn'] for index, row in queues.iterrows()]
-    return data
+    return queues['Arn'].to_numpy().tolist()
+
+
+def list_all(client, operation, result_key, **kwargs):
+    """
+    Collect every item of a paginated Connect list operation.
+
+    Args:
+        client (botocore.client.BaseClient): Amazon Connect client.
+        operation (str): Name of the Connect list operation, e.g. 'list_users'.
+        result_key (str): Response key holding the items, e.g. 'UserSummaryList'.
+        **kwargs: Parameters passed to the operation.
+
+    Returns:
+        list: Items from all pages.
+    """
+    pages = client.get_paginator(operation).paginate(
+        PaginationConfig={'PageSize': 1000},
+        **kwargs
+    )
+    return [item for page in pages for item in page[result_key]]
 
 
 def load_configuration(connect_instance_id):
@@ -33,22 +90,30 @@ def load_configuration(connect_instance_id):
         bool: True if the configuration was loaded successfully, False otherwise.
     """
     try:
-        res = connect_client.describe_instance(InstanceId=connect_instance_id)
+        client = get_connect_client()
+
+        # The calls are independent network round-trips, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            instance_future = executor.submit(client.describe_instance, InstanceId=connect_instance_id)
+            queues_future = executor.submit(list_all, client, 'list_queues', 'QueueSummaryList',
+                                            InstanceId=connect_instance_id, QueueTypes=['STANDARD'])
+            users_future = executor.submit(list_all, client, 'list_users', 'UserSummaryList',
+                                           InstanceId=connect_instance_id)
+
+        res = instance_future.result()
         connect_filtered = {k: v for k, v in res['Instance'].items() if k in ['Id', 'Arn']}
         with open('connect.json', 'w') as f:
             json.dump(connect_filtered, f)
 
         # Load queues
-        res = connect_client.list_queues(InstanceId=connect_instance_id, QueueTypes=['STANDARD'])
-        df = pd.DataFrame(res['QueueSummaryList'])
+        df = pd.DataFrame(queues_future.result())
         if len(df) > 0:
-            df.to_csv("queues.csv", index=False)
+            df[['Id', 'Arn', 'Name']].to_parquet("queues.parquet", compression="snappy")
 
         # Load users
-        res = connect_client.list_users(InstanceId=connect_instance_id)
-        df = pd.DataFrame(res['UserSummaryList'])
+        df = pd.DataFrame(users_future.result())
         if len(df) > 0:
-            df.to_csv("users.csv", index=False)
+            df[['Id', 'Username']].to_parquet("users.parquet", compression="snappy")
 
         st.success("Configuration loaded!")
         return True
@@ -68,21 +133,25 @@ def load_user_data(connect_instance_id, queues_selected):
     Returns:
         pd.DataFrame: DataFrame containing user data.
     """
-    res = connect_client.get_current_user_data(
+    res = get_connect_client().get_current_user_data(
         InstanceId=connect_instance_id,
         Filters={'Queues': get_selected_queues(queues_selected)}
     )
+    user_data_list = res['UserDataList']
+
+    df = read_users(os.path.getmtime("users.parquet"))
+
+    if not user_data_list:
+        return pd.DataFrame(columns=['UserName', 'StatusName'])
 
-    df = pd.read_csv("users.csv")
+    records = pd.json_normalize(user_data_list, sep='_')[['User_Id', 'Status_StatusName']]
+    records = records.rename(columns={'User_Id': 'UserId', 'Status_StatusName': 'StatusName'})
 
-    user_data = []
-    for user in res['UserDataList']:
-        user_id = user['User']['Id']
-        user_name = df.loc[df['Id'] == user_id, 'Username'].values[0]
-        status_name = user['Status']['StatusName']
-        user_data.append({'UserName': user_name, 'StatusName': status_name})
+    user_data = records.merge(df, left_on='UserId', right_on='Id', how='left')
+    # Users missing from the users file (e.g. created after Load) fall back to their Id
+    user_data['UserName'] = user_data['Username'].fillna(user_data['UserId'])
 
-    return pd.DataFrame(user_data)
+    return user_data[['UserName', 'StatusName']]
 
 
 def main():
@@ -110,13 +179,13 @@ def main():
                 st.stop()
 
     # Queue configuration
-    if os.path.exists('queues.csv'):
-        queues = pd.read_csv("queues.csv")
+    if os.path.exists('queues.parquet'):
+        queues = read_queues(os.path.getmtime("queues.parquet"))
         queues_name_selected = st.multiselect('Queues', queues['Name'])
         queues_selected = queues[queues['Name'].isin(queues_name_selected)]
 
     # Load user data
-    if os.path.exists('queues.csv'):
+    if os.path.exists('queues.parquet'):
         load_user_button = st.button('Load Users')
         if load_user_button:
             user_data = load_user_data(connect_instance_id, queues_selected)